@@ -16,22 +16,44 @@ and/or use the association with the output variable (Y).
 
 """
 
+import math
+
 import networkx as nx
 import numpy as np
+import scipy.sparse
 import scipy.stats
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations
+from multiprocessing import Pool, shared_memory
 from random import sample, seed
 
+try: # numba is optional, without it the scipy per-pair paths are used
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        def wrap(fun):
+            return fun
+        return wrap
+    prange = range
+
+_POOL_MIN_PAIRS = 1000 # below this many pairs the pool start-up cost dominates
+_POOL_CHUNK = 500 # pairs per task, amortizes the IPC overhead
+_L2_SIZE = 1 << 20 # assumed per-core L2 size in bytes, sets the GEMM tile width
+
 def test_data0(n=5000):
     # Everything is a function of everything. Nothing gets deleted by PFA.
     # 1 -- 0
     # |    |
     # \   /
     #   2
-    A = 5*np.random.rand(n, 3)
+    # column-major, the correlation stage works column-wise
+    A = np.asfortranarray(5*np.random.rand(n, 3))
 
-    A[:, 1] = 0.6*A[:, 0] # proportional
-    A[:, 2] = 0.3*A[:, 0] + 1.5*A[:, 1] # linear combination
+    np.multiply(A[:, 0], 0.6, out=A[:, 1]) # proportional
+    np.multiply(A[:, 0], 0.3, out=A[:, 2]) # linear combination
+    A[:, 2] += 1.5*A[:, 1]
     return A
 
 def test_data1(n=5000):
@@ -39,20 +61,24 @@ def test_data1(n=5000):
     # 2 -- 3 -- 0
     #      |    |
     #      1 -- 4
-    A = 5*np.random.rand(n, 5)
+    A = np.asfortranarray(5*np.random.rand(n, 5))
 
-    A[:, 3] = 2*A[:, 0]*A[:, 1]*A[:, 2]
-    A[:, 4] = A[:, 0]*A[:, 1]
-    return A    
+    np.multiply(A[:, 0], A[:, 1], out=A[:, 4])
+    np.multiply(A[:, 4], A[:, 2], out=A[:, 3])
+    A[:, 3] *= 2
+    return A
 
 def test_data2(n=5000):
     # Test data from the package: 0 & 1 are independent
     # 2 -- 0 -- 3 -- 1 -- 4
-    A=5*np.random.rand(n, 5)
+    A=np.asfortranarray(5*np.random.rand(n, 5))
 
-    A[:,2]=A[:,0]*0.01 + 5
-    A[:,3]=A[:,0]*A[:,1]**2 # this serves as a bridge between ind islands 0 & 1
-    A[:,4]=np.exp(-A[:,1])
+    np.multiply(A[:,0], 0.01, out=A[:,2])
+    A[:,2] += 5
+    np.multiply(A[:,1], A[:,1], out=A[:,3])
+    A[:,3] *= A[:,0] # this serves as a bridge between ind islands 0 & 1
+    np.negative(A[:,1], out=A[:,4])
+    np.exp(A[:,4], out=A[:,4])
 
     return A
 
@@ -61,22 +87,27 @@ def test_data3(n=5000):
     # 2 -- 0
     # 1 -- 3
     # |_ 4_|
-    A=5*np.random.rand(n, 5)
+    A=np.asfortranarray(5*np.random.rand(n, 5))
 
-    A[:,2]=A[:,0]*0.01 + 5
-    A[:,3]=A[:,1]**2
-    A[:,4]=np.exp(-A[:,1]) # via 1: 3 -- 4
+    np.multiply(A[:,0], 0.01, out=A[:,2])
+    A[:,2] += 5
+    np.multiply(A[:,1], A[:,1], out=A[:,3])
+    np.negative(A[:,1], out=A[:,4]) # via 1: 3 -- 4
+    np.exp(A[:,4], out=A[:,4])
 
-    return A    
+    return A
 
 def test_data4(n=5000):
     # Two alternative splits of the graph: at 1 or 0
     # 2 & 0 are independent
     # 2 -- 1 -- 0 -- 3
     #            \__ 4
-    A = 5*np.random.rand(n, 5)
-    A[:, 2] = A[:, 1]*14 + 0.01
-    A[:, 0] = A[:, 1]*A[:, 3]**2 + 10*np.exp(-A[:, 4])
+    A = np.asfortranarray(5*np.random.rand(n, 5))
+    np.multiply(A[:, 1], 14, out=A[:, 2])
+    A[:, 2] += 0.01
+    np.multiply(A[:, 3], A[:, 3], out=A[:, 0])
+    A[:, 0] *= A[:, 1]
+    A[:, 0] += 10*np.exp(-A[:, 4])
 
     return A
 
@@ -88,7 +119,238 @@ def ex_cor_fun(x, y, alt='two-sided'):
     """
     return scipy.stats.kendalltau(x, y, variant='c', alternative=alt)
 
-def cor_mat(X, meth="p", **kwargs):
+def _pool_init(shm_name, shape, dtype, cor_fun, cor_kwargs):
+    # Worker initializer: attach to the shared-memory copy of X once
+    # per process instead of pickling columns with every task.
+    global _shm, _shm_X, _shm_cor_fun, _shm_cor_kwargs
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    _shm_X = np.ndarray(shape, dtype=dtype, buffer=_shm.buf)
+    _shm_cor_fun = cor_fun
+    _shm_cor_kwargs = cor_kwargs
+
+def _cor_pairs_worker(chunk):
+    # Compute a chunk of column pairs on the shared X, return
+    # (i, j, cor, pval) tuples to be filled into C and P.
+    out = []
+    for i, j in chunk:
+        cor, pval = _shm_cor_fun(_shm_X[:, i], _shm_X[:, j], **_shm_cor_kwargs)
+        out.append((i, j, cor, pval))
+    return out
+
+def _cor_pairs_pool(X, pairs, cor_fun, n_jobs, **kwargs):
+    """Evaluate cor_fun over the given column pairs of X in a
+    multiprocessing Pool.
+
+    X is shared with the workers through multiprocessing.shared_memory
+    and the pairs are dispatched in chunks of _POOL_CHUNK. cor_fun and
+    kwargs must be picklable (module-level functions are).
+
+    Output: list of (i, j, cor, pval) tuples, in arbitrary order.
+
+    """
+    shm = shared_memory.SharedMemory(create=True, size=X.nbytes)
+    try:
+        X_shared = np.ndarray(X.shape, dtype=X.dtype, buffer=shm.buf)
+        X_shared[:] = X
+        chunks = [pairs[k:k + _POOL_CHUNK] for k in range(0, len(pairs), _POOL_CHUNK)]
+        results = []
+        with Pool(n_jobs, initializer=_pool_init,
+                  initargs=(shm.name, X.shape, X.dtype, cor_fun, kwargs)) as pool:
+            for chunk_result in pool.imap_unordered(_cor_pairs_worker, chunks):
+                results.extend(chunk_result)
+        return results
+    finally:
+        shm.close()
+        shm.unlink()
+
+def _pearson_mat(X):
+    """Vectorized Pearson correlation of all column pairs.
+
+    A single matrix product of the mean-centered, normalized columns
+    replaces the per-pair scipy.stats.pearsonr calls. The p-values
+    follow in closed form from the t-statistic of each coefficient
+    (two-sided test, as in pearsonr).
+
+    Input:
+
+    X: input data matrix (n_obs x n_feat)
+
+    Output:
+
+    C_full: full correlation matrix (n_feat x n_feat)
+
+    P_full: full p-value matrix (n_feat x n_feat)
+
+    """
+    n_obs, n_feat = X.shape
+    # one fused pass accumulating sum and sum of squares per column,
+    # instead of separate passes for the mean and the centered norm
+    s1 = X.sum(axis=0)
+    s2 = np.einsum('ij,ij->j', X, X) # no X*X temporary
+    mean = s1 / n_obs
+    norm = np.sqrt(np.maximum(s2 - n_obs * mean * mean, 0.0))
+    Xn = (X - mean) / norm
+    # single precision is plenty for a p-value threshold test on the
+    # coefficients and halves the GEMM memory traffic; the t-statistic
+    # below is computed in float64 again
+    Xn = Xn.astype(np.float32, copy=False)
+    # tile the product so a column block of Xn stays resident in L2
+    # and is reused across the blocks it is paired with
+    bs = max(16, _L2_SIZE // (Xn.itemsize * n_obs))
+    if bs >= n_feat:
+        C_full = (Xn.T @ Xn).astype(np.float64)
+    else:
+        C_full = np.zeros((n_feat, n_feat)) # only the block upper triangle is filled
+        for i0 in range(0, n_feat, bs):
+            i1 = min(i0 + bs, n_feat)
+            for j0 in range(i0, n_feat, bs):
+                j1 = min(j0 + bs, n_feat)
+                C_full[i0:i1, j0:j1] = Xn[:, i0:i1].T @ Xn[:, j0:j1]
+    np.clip(C_full, -1.0, 1.0, out=C_full)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = C_full * np.sqrt((n_obs - 2) / (1.0 - C_full**2))
+    P_full = 2 * scipy.stats.t.sf(np.abs(t), n_obs - 2) # sf(inf) = 0, i.e. P = 0 for |cor| = 1
+    return C_full, P_full
+
+@njit(cache=True)
+def _count_inversions(a):
+    # Bottom-up merge sort counting the strict inversions of a; equal
+    # elements are not counted, so on y sorted by (x, y) this is
+    # exactly the number of discordant pairs.
+    n = a.shape[0]
+    arr = a.copy()
+    buf = np.empty(n, dtype=a.dtype)
+    inv = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i = lo
+            j = mid
+            k = lo
+            while i < mid and j < hi:
+                if arr[j] < arr[i]:
+                    buf[k] = arr[j]
+                    j += 1
+                    inv += mid - i
+                else:
+                    buf[k] = arr[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                buf[k] = arr[i]
+                i += 1
+                k += 1
+            while j < hi:
+                buf[k] = arr[j]
+                j += 1
+                k += 1
+        arr, buf = buf, arr
+        width *= 2
+    return inv
+
+@njit(cache=True)
+def _kendall_tau(x, y, variant_c):
+    # Kendall tau of one column pair with the merge-sort concordance
+    # count (O(N log N) instead of the naive O(N^2)), following the
+    # tie-corrected formulas used by scipy.stats.kendalltau. Returns
+    # (tau, p) with the asymptotic normal two-sided p-value.
+    n = x.shape[0]
+    # sort by x with y as the tie breaker (two stable sorts)
+    perm = np.argsort(y, kind='mergesort')
+    xs = x[perm]
+    ys = y[perm]
+    perm = np.argsort(xs, kind='mergesort')
+    xs = xs[perm]
+    ys = ys[perm]
+    tot = n * (n - 1) // 2
+    # scan the x tie groups: tie counts and joint (x, y) ties
+    xtie = 0
+    x0 = 0.0
+    x1 = 0.0
+    ntie = 0
+    nx_classes = 0
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and xs[j] == xs[i]:
+            j += 1
+        t = j - i
+        nx_classes += 1
+        xtie += t * (t - 1) // 2
+        x0 += t * (t - 1.0) * (t - 2)
+        x1 += t * (t - 1.0) * (2 * t + 5)
+        k0 = i
+        while k0 < j:
+            k1 = k0 + 1
+            while k1 < j and ys[k1] == ys[k0]:
+                k1 += 1
+            u = k1 - k0
+            ntie += u * (u - 1) // 2
+            k0 = k1
+        i = j
+    # same scan for the y tie groups
+    ysort = np.sort(y)
+    ytie = 0
+    y0 = 0.0
+    y1 = 0.0
+    ny_classes = 0
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and ysort[j] == ysort[i]:
+            j += 1
+        t = j - i
+        ny_classes += 1
+        ytie += t * (t - 1) // 2
+        y0 += t * (t - 1.0) * (t - 2)
+        y1 += t * (t - 1.0) * (2 * t + 5)
+        i = j
+    dis = _count_inversions(ys)
+    con_minus_dis = tot - xtie - ytie + ntie - 2 * dis
+    if variant_c:
+        minclasses = min(nx_classes, ny_classes)
+        tau = 2.0 * con_minus_dis / (n * n * (minclasses - 1.0) / minclasses)
+    else:
+        tau = con_minus_dis / math.sqrt(1.0 * (tot - xtie)) / math.sqrt(1.0 * (tot - ytie))
+    tau = min(1.0, max(-1.0, tau))
+    # asymptotic normal distribution of con_minus_dis with tie terms
+    m = n * (n - 1.0)
+    var = (m * (2 * n + 5) - x1 - y1) / 18 + (2.0 * xtie * ytie) / m + x0 * y0 / (9 * m * (n - 2))
+    z = con_minus_dis / math.sqrt(var)
+    p = math.erfc(abs(z) / math.sqrt(2.0))
+    return tau, p
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _kendall_matrix(X, variant_c):
+    """JIT Kendall tau over all column pairs of X.
+
+    prange over the linear upper-triangular pair indices; each pair
+    runs the merge-sort based _kendall_tau kernel. variant_c selects
+    tau-c, otherwise tau-b (the kendalltau default). Writes into
+    preallocated C (zeros) and P (ones), keeping the upper-triangular
+    convention of cor_mat.
+
+    """
+    n_feat = X.shape[1]
+    C = np.zeros((n_feat, n_feat))
+    P = np.ones((n_feat, n_feat))
+    n_pairs = n_feat * (n_feat - 1) // 2
+    for k in prange(n_pairs):
+        # invert the linear pair id into the (i, j) upper-triangular indices
+        i = int((2 * n_feat - 1 - math.sqrt((2.0 * n_feat - 1) ** 2 - 8.0 * k)) // 2)
+        while i * (2 * n_feat - i - 1) // 2 > k: # guard against float rounding
+            i -= 1
+        while (i + 1) * (2 * n_feat - i - 2) // 2 <= k:
+            i += 1
+        j = k - i * (2 * n_feat - i - 1) // 2 + i + 1
+        tau, p = _kendall_tau(np.ascontiguousarray(X[:, i]), np.ascontiguousarray(X[:, j]), variant_c)
+        C[i, j] = tau
+        P[i, j] = p
+    return C, P
+
+def cor_mat(X, meth="p", n_jobs=1, **kwargs):
     """Correlation matrix calculation.
 
     Input:
@@ -101,19 +363,49 @@ def cor_mat(X, meth="p", **kwargs):
     respectively. Alternatively, if meth is a callable/function, it
     defines a custom correlation function.
 
+    n_jobs: number of worker processes for the per-pair methods ('k'
+    or a callable). The default 1 keeps everything in this process;
+    None uses all cores. Ignored for the vectorized 'p'/'s' paths and
+    when there are fewer than _POOL_MIN_PAIRS pairs.
+
     **kwargs: arguments to the correlation function (see ex_cor_fun in
-      this module), including the scipy.stats functions.
+      this module), including the scipy.stats functions. For 'p' and
+      's' without extra arguments the whole matrix is computed at once
+      (see _pearson_mat; 's' ranks the columns first) instead of
+      looping over the pairs. The 's' p-values then come from the
+      t-distribution, which is the large-sample approximation also
+      used by spearmanr; pass any keyword argument (e.g.
+      alternative='two-sided') to force the per-pair scipy calls. For
+      'k' with numba installed a JIT kernel (see _kendall_matrix)
+      computes all pairs in parallel with the asymptotic p-value;
+      pass e.g. method='exact' to force the scipy calls instead.
 
     Output:
 
-    C: correlation matrix (n_feat x n_feat), up-triangular only
+    C: packed correlation coefficients, 1-d array of length
+    n_feat*(n_feat-1)/2 holding the upper triangle row by row
+
+    P: packed correlation p-values, same layout as C
 
-    P: correlation p-values (n_feat x n_feat), up-triangular only
+    idx_i, idx_j: feature index pairs such that C[k], P[k] belong to
+    the feature pair (idx_i[k], idx_j[k]), idx_i[k] < idx_j[k]
 
     """
     n = X.shape[1]
-    C = np.zeros((n, n)) # container for cor coef, may be optimized to be sparse
-    P = np.ones((n, n)) # container for cor P-val, may be optimized to be sparse
+    idx_i, idx_j = np.triu_indices(n, k=1) # row-major upper triangle, same order as combinations(range(n), 2)
+    if(meth == 's' and not kwargs): # Spearman is Pearson on the per-column ranks
+        X = np.apply_along_axis(scipy.stats.rankdata, 0, X)
+        meth = 'p' # fall through to the vectorized Pearson path
+    if(meth == 'k' and _HAVE_NUMBA and set(kwargs) <= {'variant'}
+       and kwargs.get('variant', 'b') in ('b', 'c')): # JIT kernel instead of per-pair kendalltau calls
+        C_full, P_full = _kendall_matrix(X, kwargs.get('variant', 'b') == 'c')
+        return C_full[idx_i, idx_j], P_full[idx_i, idx_j], idx_i, idx_j
+    if(meth == 'p' and not kwargs): # vectorized path, one matrix product instead of n*(n-1)/2 pearsonr calls
+        C_full, P_full = _pearson_mat(X)
+        return C_full[idx_i, idx_j], P_full[idx_i, idx_j], idx_i, idx_j
+    n_cmb = idx_i.shape[0]
+    C = np.zeros(n_cmb) # packed containers, half the memory of the full matrices
+    P = np.ones(n_cmb)
     cmb = combinations(range(n), 2)
     if(hasattr(meth, '__call__')):
         cor_fun = meth
@@ -128,13 +420,21 @@ def cor_mat(X, meth="p", **kwargs):
             raise ValueError ("Unknown symbol %s" % meth)
     else:
         raise ValueError("Unknown type of method")
-            
-    for c in cmb:
-        cor, pval = cor_fun(X[:, c[0]], X[:, c[1]], **kwargs)
-        C[c[0], c[1]] = cor
-        P[c[0], c[1]] = pval
 
-    return C, P
+    pairs = list(cmb)
+    if(n_jobs != 1 and len(pairs) >= _POOL_MIN_PAIRS):
+        # the pairs are independent, spread them over the cores
+        for i, j, cor, pval in _cor_pairs_pool(X, pairs, cor_fun, n_jobs, **kwargs):
+            k = i * (2 * n - i - 1) // 2 + (j - i - 1) # linear index of (i, j) in the packed triangle
+            C[k] = cor
+            P[k] = pval
+    else:
+        for k, c in enumerate(pairs):
+            cor, pval = cor_fun(X[:, c[0]], X[:, c[1]], **kwargs)
+            C[k] = cor
+            P[k] = pval
+
+    return C, P, idx_i, idx_j
 
 def cor_adj_mat(X, meth='p', alpha=0.05, correct=False, **kwargs):
     """Construct an adjacency matrix from the correlation matrix
@@ -158,31 +458,38 @@ def cor_adj_mat(X, meth='p', alpha=0.05, correct=False, **kwargs):
 
     Output:
 
-    A: boolean adjacency matrix (n_feat x n_feat), up-triangular only
+    A: sparse boolean adjacency matrix (scipy.sparse CSR, n_feat x
+    n_feat), up-triangular only, holding only the significant pairs
 
     """
-    C, P = cor_mat(X, meth=meth, **kwargs)
+    C, P, idx_i, idx_j = cor_mat(X, meth=meth, **kwargs)
+    n = X.shape[1]
+    threshold = alpha
     if correct: # simple P-val correction
-        n = C.shape[1] # C/P must be square upper triangular
-        n_cmb = n*(n-1) / 2
+        n_cmb = P.shape[0] # packed length = n*(n-1)/2 comparisons
         print("N. comparisons:", str(n_cmb))
-        P = P * n_cmb
-    return P < alpha
+        threshold = alpha / n_cmb # P*n_cmb < alpha, without touching the P array
+    keep = P < threshold
+    return scipy.sparse.csr_matrix((np.ones(np.count_nonzero(keep), dtype=bool),
+                                    (idx_i[keep], idx_j[keep])), shape=(n, n))
 
 def cor_graph(cor_adj_mat):
     """Construct dependency graph from adjacency matrix.
 
     Input:
 
-    cor_adj_mat: numpy 2d array of the adjacency matrix. In this
-    module, it is a boolean and upper-triangular matrix.
+    cor_adj_mat: scipy.sparse adjacency matrix as produced by
+    cor_adj_mat above (boolean, up-triangular). A dense numpy 2d array
+    is converted on the fly.
 
     Output:
 
     NetworkX graph object of the dependency graph.
 
     """
-    return nx.from_numpy_matrix(cor_adj_mat)
+    if not scipy.sparse.issparse(cor_adj_mat):
+        cor_adj_mat = scipy.sparse.csr_matrix(cor_adj_mat)
+    return nx.from_scipy_sparse_array(cor_adj_mat)
 
 def pfa1_full(X, meth='p', alpha=0.05, correct=True, rnd_seed=None, **kwargs):
     """Core Algorithm 1 of PFA. Full pipelined implementation.
@@ -222,16 +529,133 @@ def pfa1_full(X, meth='p', alpha=0.05, correct=True, rnd_seed=None, **kwargs):
     subgr, subgr_nodes, subgr_edges = pfa1(gr, rnd_state=rnd_seed)
     return subgr, subgr_nodes, subgr_edges
 
-def pfa1(graph, rnd_state=None):
-    """Core Algorithm 1 of PFA with random initialization of the connected
-    components (cc).
+def _is_complete(g):
+    # A graph is complete iff it has all k*(k-1)/2 possible edges --
+    # a single integer comparison instead of materializing the
+    # complement graph.
+    k = g.number_of_nodes()
+    return g.number_of_edges() == k * (k - 1) // 2
+
+_BITSET_MAX_NODES = 1024 # above this the per-row word count makes plain BFS competitive again
+
+def _dense_bitset(g):
+    """uint64 bitset adjacency of graph g.
+
+    Output: (nodes, rows) where the position in nodes fixes the bit
+    numbering and rows[i] is the neighborhood of nodes[i] packed into
+    64-bit words, so whole-neighborhood set operations become single
+    numpy ops (64 edge tests per word).
+
+    """
+    nodes = list(g)
+    index = {u: i for i, u in enumerate(nodes)}
+    n_words = (len(nodes) + 63) // 64
+    rows = np.zeros((len(nodes), n_words), dtype=np.uint64)
+    one = np.uint64(1)
+    for a, b in g.edges:
+        ia, ib = index[a], index[b]
+        rows[ia, ib >> 6] |= one << np.uint64(ib & 63)
+        rows[ib, ia >> 6] |= one << np.uint64(ia & 63)
+    return nodes, rows
+
+def _bits_to_indices(mask):
+    # indices of the set bits of a packed uint64 word vector
+    return np.flatnonzero(np.unpackbits(mask.view(np.uint8), bitorder='little'))
+
+def _is_complete_bitset(rows):
+    # complete iff every neighborhood row has all v-1 bits set
+    v = rows.shape[0]
+    return bool(np.all(np.bitwise_count(rows).sum(axis=1) == v - 1))
+
+def _components_bitset(rows):
+    # connected components by SWAR BFS: the next frontier is the OR of
+    # the frontier neighborhood rows masked against the unseen set --
+    # the sweep stays in numpy instead of Python dict iteration
+    v, n_words = rows.shape
+    unseen = np.full(n_words, ~np.uint64(0))
+    if v & 63:
+        unseen[-1] = (np.uint64(1) << np.uint64(v & 63)) - np.uint64(1) # clear the pad bits
+    components = []
+    live = _bits_to_indices(unseen)
+    while live.size > 0:
+        start = live[0]
+        comp = np.zeros(n_words, dtype=np.uint64)
+        comp[start >> 6] = np.uint64(1) << np.uint64(start & 63)
+        unseen &= ~comp
+        frontier = np.array([start])
+        while frontier.size > 0:
+            nxt = np.bitwise_or.reduce(rows[frontier], axis=0) & unseen
+            comp |= nxt
+            unseen &= ~nxt
+            frontier = _bits_to_indices(nxt)
+        components.append(_bits_to_indices(comp))
+        live = _bits_to_indices(unseen)
+    return components
+
+def _split_components(g, frontier):
+    # Connected components of g seeded from the former neighbors of
+    # the removed cut nodes. The graph was connected before the cut,
+    # so every new component contains at least one frontier node and
+    # the BFS only walks the affected regions instead of rescanning
+    # the whole graph.
+    v = g.number_of_nodes()
+    if 0 < v <= _BITSET_MAX_NODES and 4 * g.number_of_edges() >= v * (v - 1):
+        # small dense graph: sweep a bitset adjacency instead of
+        # Python-level neighbor dicts
+        nodes, rows = _dense_bitset(g)
+        return [{nodes[i] for i in comp} for comp in _components_bitset(rows)]
+    visited = set()
+    components = []
+    for start in frontier:
+        if start in visited:
+            continue
+        comp = nx.node_connected_component(g, start)
+        visited |= comp
+        components.append(comp)
+    return components
+
+def _cut_nodes(g):
+    # Any articulation point is already a minimum cut of size 1, and
+    # Tarjan's search finds one in O(V+E) -- on trees and other
+    # bridge-rich dependency graphs this preempts the O(V*E) max-flow
+    # run entirely. Only biconnected graphs fall through to
+    # nx.minimum_node_cut.
+    for node in nx.articulation_points(g):
+        return {node}
+    return nx.minimum_node_cut(g)
+
+def _process_subgraph(g):
+    # Dissect one non-complete subgraph: find its minimum cut, remove
+    # the cut nodes and split into components. Runs in a worker
+    # process when pfa1 is called with n_jobs != 1, so g must be a
+    # standalone (picklable) graph, not a view.
+    set_nodes_to_delete = _cut_nodes(g)
+    frontier = {nbr for node in set_nodes_to_delete
+                for nbr in g.neighbors(node)} - set_nodes_to_delete
+    for node in list(set_nodes_to_delete):
+        g.remove_node(node)
+    return set_nodes_to_delete, g, _split_components(g, frontier)
+
+def pfa1(graph, rnd_state=None, n_jobs=1, shuffle=False):
+    """Core Algorithm 1 of PFA with optional random initialization of
+    the connected components (cc).
 
     Input:
 
     graph: NetworkX graph object representing dependency graph
 
-    rnd_state: rnd generator seed if reproducibility is required. The
-    default (None) uses arbitrary seed.
+    rnd_state: rnd generator seed for shuffle=True if reproducibility
+    is required. The default (None) uses arbitrary seed.
+
+    n_jobs: number of worker processes for dissecting independent
+    subgraphs. The default 1 runs in this process; None uses all
+    cores. The minimum cuts of distinct subgraphs have no data
+    dependency, so they parallelize cleanly.
+
+    shuffle: randomize the order in which the subgraphs are processed
+    (for tie-breaking between alternative dissections). The order does
+    not matter for correctness, so the default skips the shuffling and
+    its per-element RNG calls.
 
     Output:
 
@@ -242,8 +666,11 @@ def pfa1(graph, rnd_state=None):
     Gs_edges: list of edges (tuples) of each subgraph
 
     """
-    seed(rnd_state) # seed rnd number generator, if None, then not reproducible
-    S = [graph.subgraph(c).copy() for c in nx.connected_components(graph)]
+    if shuffle:
+        seed(rnd_state) # seed rnd number generator, if None, then not reproducible
+    # subgraph views are enough here: only the graph about to be
+    # dissected is copied (just before its nodes are removed)
+    S = [graph.subgraph(c) for c in nx.connected_components(graph)]
     nS = len(S)
     print("N. cc:", str(nS))
     
@@ -252,37 +679,73 @@ def pfa1(graph, rnd_state=None):
     list_nodes_complete_sub_graphs=[] # list of lists of nodes corresponding to the complete subgraphs of list_complete_sub_graphs
 
     # filter non-complete subgraphs
-    for i in sample(S, nS): # why sample? order of subgraphs to process is not important
-        if list(nx.complement(i).edges)!=[]: # if a graph is not complete
+    for i in (sample(S, nS) if shuffle else S): # order of subgraphs to process is not important
+        if not _is_complete(i): # if a graph is not complete
             list_graphs_to_divide.append(i)
         else:
             list_complete_sub_graphs.append(i)
             list_nodes_complete_sub_graphs.append(list(i.nodes))
     n_iter = 1
+    cut_cache = {} # minimum cuts keyed by frozenset of nodes, max-flow is the dominant cost
     # remove nodes from non-complete subgraphs until only complete subgraphs are left
 
-    while list_graphs_to_divide!=[]:
-        #print("Iteration: " + str(n_iter), end="\r")
-        # any_cluster_dissected=1
-        n_graphs_to_divide = len(list_graphs_to_divide)
-        # Randomization should be here (?)
-        for current_graph in sample(list_graphs_to_divide, n_graphs_to_divide):
-            set_nodes_to_delete=nx.minimum_node_cut(current_graph)  # minimum cut algorithm
-            print(str(len(set_nodes_to_delete)) + " node(s) removed:")
-            print(set_nodes_to_delete)
-            print(" from "+str(current_graph.nodes)+" graph nodes")
-            list_graphs_to_divide.remove(current_graph) # remove the dissected graph
-            for node in list(set_nodes_to_delete):
-                current_graph.remove_node(node) # remove the minimum cut nodes
-            new_S = [current_graph.subgraph(c).copy() for c in nx.connected_components(current_graph)]
-            # Sort the new subgraphs into a list of complete subgraphs and subgraphs that can be further divided
-            for sub_graph_of_current_graph in new_S:
-                if list(nx.complement(sub_graph_of_current_graph).edges)!=[]:
-                    list_graphs_to_divide.append(sub_graph_of_current_graph)
-                else:
-                    list_complete_sub_graphs.append(sub_graph_of_current_graph)
-                    list_nodes_complete_sub_graphs.append(list(sub_graph_of_current_graph.nodes))
-        n_iter = n_iter + 1
+    executor = ProcessPoolExecutor(n_jobs) if n_jobs != 1 else None
+    try:
+        while list_graphs_to_divide!=[]:
+            #print("Iteration: " + str(n_iter), end="\r")
+            # any_cluster_dissected=1
+            n_graphs_to_divide = len(list_graphs_to_divide)
+            # Randomization should be here (?)
+            if executor is not None and n_graphs_to_divide > 1:
+                # the subgraphs are independent, dissect them in parallel;
+                # the workers need standalone copies, not views
+                pending = sample(list_graphs_to_divide, n_graphs_to_divide) if shuffle else list_graphs_to_divide
+                list_graphs_to_divide = []
+                results = executor.map(_process_subgraph, (nx.Graph(g) for g in pending))
+                for set_nodes_to_delete, rest_graph, components in results:
+                    print(str(len(set_nodes_to_delete)) + " node(s) removed:")
+                    print(set_nodes_to_delete)
+                    print(" from "+str(list(rest_graph.nodes)+list(set_nodes_to_delete))+" graph nodes")
+                    # Sort the new subgraphs into a list of complete subgraphs and subgraphs that can be further divided
+                    for c in components:
+                        sub_graph_of_current_graph = rest_graph.subgraph(c)
+                        if not _is_complete(sub_graph_of_current_graph):
+                            list_graphs_to_divide.append(sub_graph_of_current_graph)
+                        else:
+                            list_complete_sub_graphs.append(sub_graph_of_current_graph)
+                            list_nodes_complete_sub_graphs.append(list(sub_graph_of_current_graph.nodes))
+                n_iter = n_iter + 1
+                continue
+            # every pending graph gets dissected this round, so start a
+            # fresh list instead of an O(n) .remove() scan per graph
+            pending = sample(list_graphs_to_divide, n_graphs_to_divide) if shuffle else list_graphs_to_divide
+            list_graphs_to_divide = []
+            for current_graph in pending:
+                cache_key = frozenset(current_graph.nodes)
+                set_nodes_to_delete = cut_cache.get(cache_key)
+                if set_nodes_to_delete is None:
+                    set_nodes_to_delete = _cut_nodes(current_graph) # minimum cut, cheap articulation point first
+                    cut_cache[cache_key] = set_nodes_to_delete
+                print(str(len(set_nodes_to_delete)) + " node(s) removed:")
+                print(set_nodes_to_delete)
+                print(" from "+str(current_graph.nodes)+" graph nodes")
+                current_graph = current_graph.copy() # materialize the view only now that it gets mutated
+                frontier = {nbr for node in set_nodes_to_delete
+                            for nbr in current_graph.neighbors(node)} - set_nodes_to_delete
+                for node in list(set_nodes_to_delete):
+                    current_graph.remove_node(node) # remove the minimum cut nodes
+                new_S = [current_graph.subgraph(c) for c in _split_components(current_graph, frontier)]
+                # Sort the new subgraphs into a list of complete subgraphs and subgraphs that can be further divided
+                for sub_graph_of_current_graph in new_S:
+                    if not _is_complete(sub_graph_of_current_graph):
+                        list_graphs_to_divide.append(sub_graph_of_current_graph)
+                    else:
+                        list_complete_sub_graphs.append(sub_graph_of_current_graph)
+                        list_nodes_complete_sub_graphs.append(list(sub_graph_of_current_graph.nodes))
+            n_iter = n_iter + 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print("N. iterations:",str(n_iter-1))
     n = len(list_complete_sub_graphs)